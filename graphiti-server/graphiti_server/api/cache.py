@@ -0,0 +1,37 @@
+"""Short-lived in-process caches for idempotent read endpoints."""
+
+from cachetools import TTLCache
+
+from graphiti_server.config import STATUS_CHECK_INTERVAL
+
+# TTLs are short enough to stay consistent with background episode processing
+# while still absorbing bursts of repeated reads (agents polling, dashboards).
+EPISODES_CACHE_TTL = 5.0
+ENTITY_EDGE_CACHE_TTL = 5.0
+STATUS_CACHE_TTL = STATUS_CHECK_INTERVAL
+
+# (group_id, last_n) -> episodes serialized as JSON bytes
+episodes_cache: TTLCache = TTLCache(maxsize=1024, ttl=EPISODES_CACHE_TTL)
+
+# edge uuid -> FactResult
+entity_edge_cache: TTLCache = TTLCache(maxsize=1024, ttl=ENTITY_EDGE_CACHE_TTL)
+
+# "connected" -> True once Neo4j connectivity has been verified
+status_cache: TTLCache = TTLCache(maxsize=1, ttl=STATUS_CACHE_TTL)
+
+
+def invalidate_group(group_id: str) -> None:
+    """Drop cached episode listings for a group."""
+    for key in [key for key in episodes_cache if key[0] == group_id]:
+        episodes_cache.pop(key, None)
+
+
+def invalidate_entity_edge(uuid: str) -> None:
+    """Drop a cached entity edge."""
+    entity_edge_cache.pop(uuid, None)
+
+
+def clear_caches() -> None:
+    """Drop all cached graph reads."""
+    episodes_cache.clear()
+    entity_edge_cache.clear()
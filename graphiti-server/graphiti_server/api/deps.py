@@ -1,5 +1,10 @@
-"""FastAPI dependencies."""
+"""FastAPI dependencies.
 
+Dependencies are declared async so FastAPI resolves them on the event loop
+instead of dispatching each one to the threadpool.
+"""
+
+from graphiti_server.config import ServerConfig, get_config
 from graphiti_server.core import GraphitiClient
 
 # Global client instance
@@ -12,8 +17,13 @@ def set_graphiti_client(client: GraphitiClient) -> None:
     _graphiti_client = client
 
 
-def get_graphiti_client() -> GraphitiClient:
+async def get_graphiti_client() -> GraphitiClient:
     """Get the global Graphiti client."""
     if _graphiti_client is None:
         raise RuntimeError("Graphiti client not initialized")
     return _graphiti_client
+
+
+async def get_server_config() -> ServerConfig:
+    """Get the cached server configuration."""
+    return get_config()
@@ -0,0 +1,36 @@
+"""Optional per-request profiling with pyinstrument."""
+
+import logging
+
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse
+
+logger = logging.getLogger(__name__)
+
+
+def add_profiler(app: FastAPI) -> None:
+    """Profile requests that pass ?profile=true and return the report as HTML.
+
+    Requires the optional pyinstrument dependency; logs a warning and leaves the
+    app unchanged if it isn't installed.
+    """
+    try:
+        from pyinstrument import Profiler
+    except ImportError:
+        logger.warning("Profiling enabled but pyinstrument is not installed, skipping")
+        return
+
+    @app.middleware("http")
+    async def profile_request(request: Request, call_next):
+        if request.query_params.get("profile", "").lower() != "true":
+            return await call_next(request)
+
+        profiler = Profiler(async_mode="enabled")
+        profiler.start()
+        try:
+            await call_next(request)
+        finally:
+            profiler.stop()
+        return HTMLResponse(profiler.output_html())
+
+    logger.info("Request profiling enabled (add ?profile=true to a request)")
@@ -2,12 +2,13 @@
 
 import logging
 
-from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, status
 from graphiti_core.utils.maintenance.graph_data_operations import clear_data
 
-from graphiti_server.api.deps import get_graphiti_client
-from graphiti_server.config import get_config
+from graphiti_server.api import cache
+from graphiti_server.api.deps import get_graphiti_client, get_server_config
+from graphiti_server.config import ServerConfig
+from graphiti_server.core import GraphitiClient
 from graphiti_server.models import StatusResponse, SuccessResponse
 
 logger = logging.getLogger(__name__)
@@ -18,18 +19,21 @@ router = APIRouter(tags=["admin"])
 @router.get("/healthcheck")
 async def healthcheck():
     """Simple healthcheck for load balancers."""
-    return JSONResponse(content={"status": "healthy"}, status_code=200)
+    return {"status": "healthy"}
 
 
 @router.get("/api/v1/status", response_model=StatusResponse)
-async def get_status():
+async def get_status(
+    client: GraphitiClient = Depends(get_graphiti_client),
+    config: ServerConfig = Depends(get_server_config),
+):
     """Get server status and configuration."""
     try:
-        client = get_graphiti_client()
-        config = get_config()
-
-        # Test database connection
-        await client.client.driver.client.verify_connectivity()  # type: ignore
+        # Test database connection, reusing a recent successful check so
+        # frequent polling doesn't cost a Bolt round-trip per request
+        if not cache.status_cache.get("connected"):
+            await client.client.driver.client.verify_connectivity()  # type: ignore
+            cache.status_cache["connected"] = True
 
         return StatusResponse(
             status="ok",
@@ -55,12 +59,11 @@ async def get_status():
 
 
 @router.post("/api/v1/clear", response_model=SuccessResponse)
-async def clear_graph():
+async def clear_graph(client: GraphitiClient = Depends(get_graphiti_client)):
     """Clear all data from the graph and rebuild indices."""
     try:
-        client = get_graphiti_client()
-
         await clear_data(client.client.driver)
+        cache.clear_caches()
         await client.client.build_indices_and_constraints()
 
         return SuccessResponse(message="Graph cleared successfully and indices rebuilt")
@@ -1,15 +1,17 @@
 """Memory/episode management endpoints."""
 
+import asyncio
 import logging
-from datetime import datetime, timezone
 
-from fastapi import APIRouter, HTTPException, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from graphiti_core.edges import EntityEdge
-from graphiti_core.nodes import EpisodeType, EpisodicNode
+from graphiti_core.nodes import EpisodeType
 
-from graphiti_server.api.deps import get_graphiti_client
-from graphiti_server.config import get_config
-from graphiti_server.core import get_episode_queue
+from graphiti_server.api import cache
+from graphiti_server.api.deps import get_graphiti_client, get_server_config
+from graphiti_server.config import ServerConfig
+from graphiti_server.core import GraphitiClient, get_episode_queue, utcnow_cached
 from graphiti_server.models import AddMemoryRequest, AddMemoryResponse, SuccessResponse
 
 logger = logging.getLogger(__name__)
@@ -17,49 +19,80 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1", tags=["memory"])
 
 
+# Map request source strings to EpisodeType
+_SOURCE_MAP: dict[str, EpisodeType] = {
+    "text": EpisodeType.text,
+    "json": EpisodeType.json,
+    "message": EpisodeType.message,
+}
+
+
+async def _enqueue(
+    request: AddMemoryRequest,
+    client: GraphitiClient,
+    config: ServerConfig,
+    wait_for_result: bool,
+):
+    """Queue an episode on its group's queue.
+
+    Returns the queue position, or the AddEpisodeResults if wait_for_result is True.
+    """
+    source_type = _SOURCE_MAP.get(request.source, EpisodeType.text)
+
+    # Use provided group_id or fall back to default
+    group_id = request.group_id or config.default_group_id
+
+    # Get or create episode queue for this group
+    queue = await get_episode_queue(
+        group_id,
+        maxsize=config.queue_max_size,
+        workers=config.episode_workers,
+        max_queues=config.max_episode_queues,
+    )
+
+    result = await queue.add_episode(
+        client=client.client,
+        name=request.name,
+        episode_body=request.episode_body,
+        source=source_type,
+        source_description=request.source_description,
+        uuid=request.uuid,
+        use_custom_entities=config.use_custom_entities,
+        wait_for_result=wait_for_result,
+        enqueue_timeout=config.enqueue_timeout,
+    )
+
+    if wait_for_result:
+        # Processing may add episodes and invalidate existing facts
+        cache.invalidate_group(group_id)
+        cache.entity_edge_cache.clear()
+
+    return result
+
+
 @router.post("/memory", status_code=status.HTTP_202_ACCEPTED, response_model=SuccessResponse)
-async def add_memory(request: AddMemoryRequest):
+async def add_memory(
+    request: AddMemoryRequest,
+    client: GraphitiClient = Depends(get_graphiti_client),
+    config: ServerConfig = Depends(get_server_config),
+):
     """Add an episode to memory.
 
     This endpoint queues the episode for background processing and returns immediately.
     Episodes for the same group_id are processed sequentially to avoid race conditions.
     """
     try:
-        client = get_graphiti_client()
-        config = get_config()
-
-        # Map string source to EpisodeType enum
-        source_type = EpisodeType.text
-        if request.source == "message":
-            source_type = EpisodeType.message
-        elif request.source == "json":
-            source_type = EpisodeType.json
-
-        # Use provided group_id or fall back to default
-        group_id = request.group_id or config.default_group_id
-
-        # Get or create episode queue for this group
-        queue = get_episode_queue(group_id)
-
-        # Start worker if not already running
-        if not queue.is_running:
-            await queue.start_worker(lambda: None)  # Worker function is in queue.add_episode
-
-        # Add episode to queue
-        position = await queue.add_episode(
-            client=client.client,
-            name=request.name,
-            episode_body=request.episode_body,
-            source=source_type,
-            source_description=request.source_description,
-            uuid=request.uuid,
-            use_custom_entities=config.use_custom_entities,
-        )
+        position = await _enqueue(request, client, config, wait_for_result=False)
 
         return SuccessResponse(
             message=f"Episode '{request.name}' queued for processing (position: {position})"
         )
 
+    except asyncio.QueueFull as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Episode queue is full, retry later: {str(e)}",
+        )
     except Exception as e:
         logger.error(f"Error queuing episode: {str(e)}")
         raise HTTPException(
@@ -69,7 +102,11 @@ async def add_memory(request: AddMemoryRequest):
 
 
 @router.post("/memory/sync", status_code=status.HTTP_201_CREATED, response_model=AddMemoryResponse)
-async def add_memory_sync(request: AddMemoryRequest):
+async def add_memory_sync(
+    request: AddMemoryRequest,
+    client: GraphitiClient = Depends(get_graphiti_client),
+    config: ServerConfig = Depends(get_server_config),
+):
     """Add an episode to memory synchronously and return the episode UUID.
 
     This endpoint queues the episode for processing (maintaining correct order) and waits
@@ -79,43 +116,19 @@ async def add_memory_sync(request: AddMemoryRequest):
     For fire-and-forget operations with better throughput, use the async /memory endpoint.
     """
     try:
-        client = get_graphiti_client()
-        config = get_config()
-
-        # Map string source to EpisodeType enum
-        source_type = EpisodeType.text
-        if request.source == "message":
-            source_type = EpisodeType.message
-        elif request.source == "json":
-            source_type = EpisodeType.json
-
-        # Use provided group_id or fall back to default
-        group_id = request.group_id or config.default_group_id
-
-        # Get or create episode queue for this group
-        queue = get_episode_queue(group_id)
-
-        # Start worker if not already running
-        if not queue.is_running:
-            await queue.start_worker(lambda: None)
-
         # Add episode to queue and WAIT for result
-        result = await queue.add_episode(
-            client=client.client,
-            name=request.name,
-            episode_body=request.episode_body,
-            source=source_type,
-            source_description=request.source_description,
-            uuid=request.uuid,
-            use_custom_entities=config.use_custom_entities,
-            wait_for_result=True,  # This makes it synchronous
-        )
+        result = await _enqueue(request, client, config, wait_for_result=True)
 
         return AddMemoryResponse(
             message=f"Episode '{request.name}' processed successfully",
             episode_uuid=result.episode.uuid,
         )
 
+    except asyncio.QueueFull as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Episode queue is full, retry later: {str(e)}",
+        )
     except Exception as e:
         logger.error(f"Error processing episode: {str(e)}")
         raise HTTPException(
@@ -125,24 +138,37 @@ async def add_memory_sync(request: AddMemoryRequest):
 
 
 @router.get("/episodes/{group_id}", response_model=list[dict])
-async def get_episodes(group_id: str, last_n: int = 10):
+async def get_episodes(
+    group_id: str,
+    last_n: int = 10,
+    client: GraphitiClient = Depends(get_graphiti_client),
+):
     """Get the most recent episodes for a group."""
     try:
-        client = get_graphiti_client()
-
         if last_n < 1 or last_n > 100:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="last_n must be between 1 and 100",
             )
 
-        episodes = await client.client.retrieve_episodes(
-            group_ids=[group_id],
-            last_n=last_n,
-            reference_time=datetime.now(timezone.utc),
-        )
+        key = (group_id, last_n)
+        content = cache.episodes_cache.get(key)
+        if content is None:
+            episodes = await client.client.retrieve_episodes(
+                group_ids=[group_id],
+                last_n=last_n,
+                reference_time=utcnow_cached(),
+            )
 
-        return [episode.model_dump(mode="json") for episode in episodes]
+            # Serialize straight to JSON bytes in one pass instead of building
+            # JSON-mode dicts for FastAPI to validate and encode again
+            content = orjson.dumps(
+                [episode.model_dump() for episode in episodes],
+                option=orjson.OPT_UTC_Z,
+            )
+            cache.episodes_cache[key] = content
+
+        return Response(content=content, media_type="application/json")
 
     except HTTPException:
         raise
@@ -155,64 +181,65 @@ async def get_episodes(group_id: str, last_n: int = 10):
 
 
 @router.delete("/episode/{uuid}", response_model=SuccessResponse)
-async def delete_episode(uuid: str):
+async def delete_episode(uuid: str, client: GraphitiClient = Depends(get_graphiti_client)):
     """Delete an episode by UUID."""
     try:
-        client = get_graphiti_client()
-
-        episodic_node = await EpisodicNode.get_by_uuid(client.client.driver, uuid)
-        await episodic_node.delete(client.client.driver)
+        group_id = await client.delete_episode(uuid)
+        if group_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Error deleting episode: episode {uuid} not found",
+            )
+        cache.invalidate_group(group_id)
 
         return SuccessResponse(message=f"Episode with UUID {uuid} deleted successfully")
 
+    except HTTPException:
+        raise
     except Exception as e:
-        error_msg = str(e)
-        logger.error(f"Error deleting episode: {error_msg}")
-
-        status_code = (
-            status.HTTP_404_NOT_FOUND
-            if "not found" in error_msg.lower()
-            else status.HTTP_500_INTERNAL_SERVER_ERROR
+        logger.error(f"Error deleting episode: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error deleting episode: {str(e)}",
         )
 
-        raise HTTPException(status_code=status_code, detail=f"Error deleting episode: {error_msg}")
-
 
 @router.delete("/entity-edge/{uuid}", response_model=SuccessResponse)
-async def delete_entity_edge(uuid: str):
+async def delete_entity_edge(uuid: str, client: GraphitiClient = Depends(get_graphiti_client)):
     """Delete an entity edge by UUID."""
     try:
-        client = get_graphiti_client()
-
-        entity_edge = await EntityEdge.get_by_uuid(client.client.driver, uuid)
-        await entity_edge.delete(client.client.driver)
+        if not await client.delete_entity_edge(uuid):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Error deleting entity edge: edge {uuid} not found",
+            )
+        cache.invalidate_entity_edge(uuid)
 
         return SuccessResponse(message=f"Entity edge with UUID {uuid} deleted successfully")
 
+    except HTTPException:
+        raise
     except Exception as e:
-        error_msg = str(e)
-        logger.error(f"Error deleting entity edge: {error_msg}")
-
-        status_code = (
-            status.HTTP_404_NOT_FOUND
-            if "not found" in error_msg.lower()
-            else status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
-
+        logger.error(f"Error deleting entity edge: {str(e)}")
         raise HTTPException(
-            status_code=status_code, detail=f"Error deleting entity edge: {error_msg}"
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error deleting entity edge: {str(e)}",
         )
 
 
 @router.get("/entity-edge/{uuid}")
-async def get_entity_edge(uuid: str):
+async def get_entity_edge(uuid: str, client: GraphitiClient = Depends(get_graphiti_client)):
     """Get an entity edge by UUID."""
     try:
-        client = get_graphiti_client()
+        cached = cache.entity_edge_cache.get(uuid)
+        if cached is not None:
+            return cached
 
         entity_edge = await EntityEdge.get_by_uuid(client.client.driver, uuid)
 
-        return client.format_fact_result(entity_edge)
+        result = client.format_fact_result(entity_edge)
+        cache.entity_edge_cache[uuid] = result
+        return result
 
     except Exception as e:
         error_msg = str(e)
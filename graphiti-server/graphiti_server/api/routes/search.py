@@ -1,22 +1,46 @@
 """Search endpoints for nodes and facts."""
 
 import logging
+from functools import lru_cache
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from graphiti_core.search.search_config import SearchConfig
 from graphiti_core.search.search_config_recipes import (
     NODE_HYBRID_SEARCH_NODE_DISTANCE,
     NODE_HYBRID_SEARCH_RRF,
 )
 from graphiti_core.search.search_filters import SearchFilters
 
-from graphiti_server.api.deps import get_graphiti_client
-from graphiti_server.config import get_config
-from graphiti_server.models import FactSearchResponse, NodeResult, NodeSearchResponse
+from graphiti_server.api.deps import get_graphiti_client, get_server_config
+from graphiti_server.config import ServerConfig
+from graphiti_server.core import GraphitiClient
+from graphiti_server.models import (
+    ENTITY_TYPES,
+    FactSearchResponse,
+    NodeResult,
+    NodeSearchResponse,
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/search", tags=["search"])
 
+# Entity types accepted by the node search entity filter
+_VALID_ENTITIES = frozenset(ENTITY_TYPES)
+_VALID_ENTITIES_MSG = "Invalid entity type. Must be one of: " + ", ".join(sorted(_VALID_ENTITIES))
+
+
+@lru_cache(maxsize=256)
+def _get_node_search_config(center: bool, limit: int) -> SearchConfig:
+    """Get the node search config for a search mode and result limit.
+
+    Configs are built once per (center, limit) pair and shared between requests,
+    so callers must not mutate the returned instance. graphiti_core only reads
+    search configs, so a shallow copy sharing the recipe's nested configs is enough.
+    """
+    template = NODE_HYBRID_SEARCH_NODE_DISTANCE if center else NODE_HYBRID_SEARCH_RRF
+    return template.model_copy(update={"limit": limit})
+
 
 @router.get("/nodes", response_model=NodeSearchResponse)
 async def search_nodes(
@@ -25,30 +49,24 @@ async def search_nodes(
     max_nodes: int = Query(10, ge=1, le=100, description="Maximum number of nodes to return"),
     center_node_uuid: str | None = Query(None, description="Optional UUID to center search around"),
     entity: str = Query("", description="Optional entity type filter (Preference, Procedure, Requirement)"),
+    client: GraphitiClient = Depends(get_graphiti_client),
+    config: ServerConfig = Depends(get_server_config),
 ):
     """Search for entity nodes with summaries."""
     try:
-        client = get_graphiti_client()
-        config = get_config()
-
         # Use provided group_ids or fall back to default
         effective_group_ids = group_ids if group_ids else ([config.default_group_id] if config.default_group_id else [])
 
         # Configure search
-        if center_node_uuid:
-            search_config = NODE_HYBRID_SEARCH_NODE_DISTANCE.model_copy(deep=True)
-        else:
-            search_config = NODE_HYBRID_SEARCH_RRF.model_copy(deep=True)
-        search_config.limit = max_nodes
+        search_config = _get_node_search_config(bool(center_node_uuid), max_nodes)
 
         # Set up filters
         filters = SearchFilters()
         if entity:
-            valid_entities = ["Preference", "Procedure", "Requirement"]
-            if entity not in valid_entities:
+            if entity not in _VALID_ENTITIES:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid entity type. Must be one of: {', '.join(valid_entities)}",
+                    detail=_VALID_ENTITIES_MSG,
                 )
             filters.node_labels = [entity]
 
@@ -64,21 +82,24 @@ async def search_nodes(
         if not search_results.nodes:
             return NodeSearchResponse(message="No relevant nodes found", nodes=[])
 
-        # Format results
+        # Format results. Nodes come from graphiti_core already validated, so the
+        # response models are built without re-running Pydantic validation.
         formatted_nodes = [
-            NodeResult(
+            NodeResult.model_construct(
                 uuid=node.uuid,
                 name=node.name,
-                summary=node.summary if hasattr(node, "summary") else "",
-                labels=node.labels if hasattr(node, "labels") else [],
+                summary=getattr(node, "summary", ""),
+                labels=getattr(node, "labels", []),
                 group_id=node.group_id,
                 created_at=node.created_at.isoformat(),
-                attributes=node.attributes if hasattr(node, "attributes") else {},
+                attributes=getattr(node, "attributes", {}),
             )
             for node in search_results.nodes
         ]
 
-        return NodeSearchResponse(message="Nodes retrieved successfully", nodes=formatted_nodes)
+        return NodeSearchResponse.model_construct(
+            message="Nodes retrieved successfully", nodes=formatted_nodes
+        )
 
     except HTTPException:
         raise
@@ -96,12 +117,11 @@ async def search_facts(
     group_ids: list[str] | None = Query(None, description="Optional list of group IDs to filter"),
     max_facts: int = Query(10, ge=1, le=100, description="Maximum number of facts to return"),
     center_node_uuid: str | None = Query(None, description="Optional UUID to center search around"),
+    client: GraphitiClient = Depends(get_graphiti_client),
+    config: ServerConfig = Depends(get_server_config),
 ):
     """Search for facts (relationships between entities)."""
     try:
-        client = get_graphiti_client()
-        config = get_config()
-
         # Use provided group_ids or fall back to default
         effective_group_ids = group_ids if group_ids else ([config.default_group_id] if config.default_group_id else [])
 
@@ -1,10 +1,10 @@
 """Configuration management for Graphiti REST Server."""
 
 import os
-from typing import Literal
+from dataclasses import dataclass
+from functools import lru_cache
 
 from dotenv import load_dotenv
-from pydantic import BaseModel, Field
 
 load_dotenv()
 
@@ -16,8 +16,49 @@ DEFAULT_EMBEDDER_MODEL = "text-embedding-3-large"
 # Semaphore limit for concurrent operations
 SEMAPHORE_LIMIT = int(os.getenv("SEMAPHORE_LIMIT", 10))
 
+# Maximum number of pending episodes per group_id queue
+QUEUE_MAX_SIZE = int(os.getenv("QUEUE_MAX_SIZE", 256))
 
-class LLMConfig(BaseModel):
+# Seconds to wait for a free queue slot before rejecting an episode
+ENQUEUE_TIMEOUT = float(os.getenv("ENQUEUE_TIMEOUT", 5.0))
+
+# Workers per group_id queue (1 keeps episodes strictly ordered within a group)
+EPISODE_WORKERS = int(os.getenv("EPISODE_WORKERS", 1))
+
+# Maximum episodes processed concurrently across all groups
+EPISODE_CONCURRENCY = int(os.getenv("EPISODE_CONCURRENCY", SEMAPHORE_LIMIT))
+
+# Maximum number of per-group episode queues kept alive (idle ones are evicted first)
+MAX_EPISODE_QUEUES = int(os.getenv("MAX_EPISODE_QUEUES", 1000))
+
+# Threads available for blocking calls offloaded via AnyIO (default pool is 40)
+THREAD_POOL_SIZE = int(os.getenv("THREAD_POOL_SIZE", max(100, SEMAPHORE_LIMIT * 4)))
+
+# Seconds to reuse a successful Neo4j connectivity check in /api/v1/status
+STATUS_CHECK_INTERVAL = float(os.getenv("STATUS_CHECK_INTERVAL", 2.0))
+
+# Allow per-request profiling via ?profile=true (requires pyinstrument)
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+
+
+def is_gpt5_model(model: str) -> bool:
+    """Whether a model belongs to the gpt-5 family, which rejects a temperature."""
+    return "gpt-5" in model.lower()
+
+
+def normalize_temperature(model: str, temperature: str) -> float | None:
+    """Get the LLM temperature for a model from its raw setting.
+
+    gpt-5 models don't accept a temperature, so None is returned for them and
+    the raw setting is not parsed.
+    """
+    if is_gpt5_model(model):
+        return None
+    return float(temperature)
+
+
+@dataclass(slots=True, frozen=True)
+class LLMConfig:
     """Configuration for LLM client."""
 
     api_key: str
@@ -36,28 +77,24 @@ class LLMConfig(BaseModel):
         model = os.environ.get("MODEL_NAME", "").strip() or DEFAULT_LLM_MODEL
         small_model = os.environ.get("SMALL_MODEL_NAME", "").strip() or SMALL_LLM_MODEL
 
-        # Set temperature to None if model contains "gpt-5"
-        temperature: float | None = 1.0
-        if "gpt-5" in model.lower():
-            temperature = None
-        else:
-            temperature = float(os.environ.get("LLM_TEMPERATURE", "1.0"))
-
         return cls(
             api_key=api_key,
             base_url=os.environ.get("OPENAI_BASE_URL"),
             model=model,
             small_model=small_model,
-            temperature=temperature,
+            temperature=normalize_temperature(model, os.environ.get("LLM_TEMPERATURE", "1.0")),
         )
 
 
-class EmbedderConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class EmbedderConfig:
     """Configuration for embedder client."""
 
-    model: str = DEFAULT_EMBEDDER_MODEL
     api_key: str
+    model: str = DEFAULT_EMBEDDER_MODEL
     base_url: str | None = None
+    batch_window: float = 0.01
+    max_batch_size: int = 64
 
     @classmethod
     def from_env(cls) -> "EmbedderConfig":
@@ -73,10 +110,13 @@ class EmbedderConfig(BaseModel):
             api_key=api_key,
             base_url=os.environ.get("OPENAI_EMBEDDER_BASE_URL")
             or os.environ.get("OPENAI_BASE_URL"),
+            batch_window=float(os.environ.get("EMBEDDER_BATCH_WINDOW_MS", "10")) / 1000,
+            max_batch_size=int(os.environ.get("EMBEDDER_MAX_BATCH_SIZE", "64")),
         )
 
 
-class Neo4jConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Neo4jConfig:
     """Configuration for Neo4j database connection."""
 
     uri: str = "bolt://localhost:7687"
@@ -93,7 +133,8 @@ class Neo4jConfig(BaseModel):
         )
 
 
-class ServerConfig(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ServerConfig:
     """Main server configuration."""
 
     llm: LLMConfig
@@ -102,6 +143,12 @@ class ServerConfig(BaseModel):
     default_group_id: str = "default"
     use_custom_entities: bool = False
     semaphore_limit: int = SEMAPHORE_LIMIT
+    queue_max_size: int = QUEUE_MAX_SIZE
+    enqueue_timeout: float = ENQUEUE_TIMEOUT
+    episode_workers: int = EPISODE_WORKERS
+    episode_concurrency: int = EPISODE_CONCURRENCY
+    max_episode_queues: int = MAX_EPISODE_QUEUES
+    thread_pool_size: int = THREAD_POOL_SIZE
 
     @classmethod
     def from_env(cls) -> "ServerConfig":
@@ -113,19 +160,20 @@ class ServerConfig(BaseModel):
         )
 
 
-# Global config instance
+# Config set explicitly via set_config (e.g. with CLI overrides applied)
 _config: ServerConfig | None = None
 
 
+@lru_cache(maxsize=1)
 def get_config() -> ServerConfig:
     """Get the global server configuration."""
-    global _config
-    if _config is None:
-        _config = ServerConfig.from_env()
-    return _config
+    if _config is not None:
+        return _config
+    return ServerConfig.from_env()
 
 
 def set_config(config: ServerConfig) -> None:
     """Set the global server configuration."""
     global _config
     _config = config
+    get_config.cache_clear()
@@ -1,6 +1,23 @@
 """Core functionality for Graphiti REST Server."""
 
 from graphiti_server.core.client import GraphitiClient
-from graphiti_server.core.queue import EpisodeQueue, get_episode_queue, cleanup_all_queues
+from graphiti_server.core.embedder import BatchingEmbedder
+from graphiti_server.core.clock import start_clock, stop_clock, utcnow_cached
+from graphiti_server.core.queue import (
+    EpisodeQueue,
+    cleanup_all_queues,
+    get_episode_queue,
+    set_episode_concurrency,
+)
 
-__all__ = ["GraphitiClient", "EpisodeQueue", "get_episode_queue", "cleanup_all_queues"]
+__all__ = [
+    "GraphitiClient",
+    "BatchingEmbedder",
+    "EpisodeQueue",
+    "get_episode_queue",
+    "set_episode_concurrency",
+    "cleanup_all_queues",
+    "start_clock",
+    "stop_clock",
+    "utcnow_cached",
+]
@@ -12,6 +12,7 @@ from graphiti_core.embedder.client import EmbedderClient
 from graphiti_core.embedder.openai import OpenAIEmbedder, OpenAIEmbedderConfig
 
 from graphiti_server.config import ServerConfig
+from graphiti_server.core.embedder import BatchingEmbedder
 from graphiti_server.models import FactResult
 
 logger = logging.getLogger(__name__)
@@ -24,6 +25,7 @@ class GraphitiClient:
         """Initialize Graphiti client with configuration."""
         self.config = config
         self._client: Graphiti | None = None
+        self._embedder: BatchingEmbedder | None = None
 
     async def initialize(self) -> None:
         """Initialize the Graphiti client and database."""
@@ -59,6 +61,8 @@ class GraphitiClient:
         """Close the Graphiti client."""
         if self._client:
             await self._client.close()
+        if self._embedder:
+            await self._embedder.close()
 
     def _create_llm_client(self) -> LLMClient:
         """Create an LLM client from configuration."""
@@ -78,7 +82,50 @@ class GraphitiClient:
             base_url=self.config.embedder.base_url,
             embedding_model=self.config.embedder.model,
         )
-        return OpenAIEmbedder(config=embedder_config)
+        embedder = OpenAIEmbedder(config=embedder_config)
+
+        # Batch concurrent single-text embeddings (e.g. search queries) into one request
+        if self.config.embedder.batch_window > 0:
+            self._embedder = BatchingEmbedder(
+                embedder,
+                batch_window=self.config.embedder.batch_window,
+                max_batch_size=self.config.embedder.max_batch_size,
+            )
+            return self._embedder
+        return embedder
+
+    async def delete_episode(self, uuid: str) -> str | None:
+        """Delete an episode and its relationships in a single query.
+
+        Returns:
+            The group_id of the deleted episode, or None if no episode matched
+        """
+        records, _, _ = await self.client.driver.execute_query(
+            """
+            MATCH (n:Episodic {uuid: $uuid})
+            WITH n, n.group_id AS group_id
+            DETACH DELETE n
+            RETURN group_id
+            """,
+            uuid=uuid,
+        )
+        return records[0]["group_id"] if records else None
+
+    async def delete_entity_edge(self, uuid: str) -> bool:
+        """Delete an entity edge in a single query.
+
+        Returns:
+            True if an edge was deleted, False if no edge matched
+        """
+        records, _, _ = await self.client.driver.execute_query(
+            """
+            MATCH (:Entity)-[e:RELATES_TO {uuid: $uuid}]->(:Entity)
+            DELETE e
+            RETURN count(e) AS deleted
+            """,
+            uuid=uuid,
+        )
+        return bool(records) and records[0]["deleted"] > 0
 
     @property
     def client(self) -> Graphiti:
@@ -0,0 +1,52 @@
+"""Coarse wall clock for reference times that tolerate slight staleness."""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+# Seconds between clock updates
+CLOCK_RESOLUTION = 0.1
+
+_now: datetime | None = None
+_clock_task: asyncio.Task | None = None
+
+
+def utcnow_cached() -> datetime:
+    """Get the current UTC time, at most CLOCK_RESOLUTION seconds stale.
+
+    Falls back to the exact time when the clock task isn't running.
+    """
+    if _now is None:
+        return datetime.now(timezone.utc)
+    return _now
+
+
+async def _tick() -> None:
+    """Refresh the cached time until cancelled."""
+    global _now
+    while True:
+        _now = datetime.now(timezone.utc)
+        await asyncio.sleep(CLOCK_RESOLUTION)
+
+
+def start_clock() -> None:
+    """Start refreshing the cached time in the background."""
+    global _clock_task
+    if _clock_task is None:
+        _clock_task = asyncio.create_task(_tick())
+        logger.info("Started cached clock")
+
+
+async def stop_clock() -> None:
+    """Stop the background clock and fall back to exact time."""
+    global _clock_task, _now
+    if _clock_task is not None:
+        _clock_task.cancel()
+        try:
+            await _clock_task
+        except asyncio.CancelledError:
+            pass
+    _clock_task = None
+    _now = None
@@ -0,0 +1,144 @@
+"""Embedder wrapper that micro-batches concurrent single-text embedding calls."""
+
+import asyncio
+import logging
+from collections.abc import Iterable
+
+from graphiti_core.embedder.client import EmbedderClient
+
+logger = logging.getLogger(__name__)
+
+_Item = tuple[str, asyncio.Future[list[float]]]
+
+
+class BatchingEmbedder(EmbedderClient):
+    """Collects concurrent single-text embedding requests into one batch call.
+
+    Each create() call for a single string waits up to batch_window seconds for
+    other callers to join, then all collected texts are embedded with a single
+    create_batch() request to the wrapped embedder. Batches are dispatched in
+    the background, so collection of the next batch starts immediately. If a
+    batch request fails, its texts are retried one by one with create().
+    """
+
+    def __init__(
+        self,
+        inner: EmbedderClient,
+        batch_window: float = 0.01,
+        max_batch_size: int = 64,
+    ):
+        """Initialize the batching embedder.
+
+        Args:
+            inner: Embedder used to compute the embeddings
+            batch_window: Seconds to wait for more texts after the first one arrives
+            max_batch_size: Maximum number of texts per batch request
+        """
+        self.inner = inner
+        self.batch_window = batch_window
+        self.max_batch_size = max(1, max_batch_size)
+        self._queue: asyncio.Queue[_Item] = asyncio.Queue()
+        self._collector_task: asyncio.Task | None = None
+        # Items taken off the queue but not yet dispatched, and items per dispatched batch
+        self._collecting: list[_Item] = []
+        self._batches: dict[asyncio.Task, list[_Item]] = {}
+
+    async def create(
+        self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
+    ) -> list[float]:
+        """Embed a single text, batched with concurrent callers."""
+        if isinstance(input_data, str):
+            text = input_data
+        elif (
+            isinstance(input_data, list)
+            and len(input_data) == 1
+            and isinstance(input_data[0], str)
+        ):
+            text = input_data[0]
+        else:
+            # Token inputs and multi-text inputs are passed through unchanged
+            return await self.inner.create(input_data)
+
+        if self._collector_task is None or self._collector_task.done():
+            self._collector_task = asyncio.create_task(self._collect())
+
+        future: asyncio.Future[list[float]] = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        """Embed a list of texts; already batched, so passed straight through."""
+        return await self.inner.create_batch(input_data_list)
+
+    async def _collect(self) -> None:
+        """Group queued texts into batches and dispatch them."""
+        while True:
+            items = self._collecting = [await self._queue.get()]
+
+            # Give concurrent callers a chance to join this batch
+            await asyncio.sleep(self.batch_window)
+            while len(items) < self.max_batch_size:
+                try:
+                    items.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            self._collecting = []
+            task = asyncio.create_task(self._embed(items))
+            self._batches[task] = items
+            task.add_done_callback(self._batches.pop)
+
+    async def _embed(self, items: list[_Item]) -> None:
+        """Embed one batch and resolve the waiting callers."""
+        try:
+            embeddings = await self.inner.create_batch([text for text, _ in items])
+        except Exception as e:
+            logger.warning(
+                f"Error embedding batch of {len(items)} texts, retrying one by one: {str(e)}"
+            )
+        else:
+            if len(embeddings) == len(items):
+                for (_, future), embedding in zip(items, embeddings):
+                    if not future.done():
+                        future.set_result(embedding)
+                return
+            logger.warning(
+                f"Batch of {len(items)} texts returned {len(embeddings)} embeddings, "
+                "retrying one by one"
+            )
+
+        await asyncio.gather(*(self._embed_one(text, future) for text, future in items))
+
+    async def _embed_one(self, text: str, future: asyncio.Future[list[float]]) -> None:
+        """Embed a single text with the wrapped embedder and resolve its caller."""
+        try:
+            embedding = await self.inner.create(text)
+        except Exception as e:
+            logger.error(f"Error embedding text: {str(e)}")
+            if not future.done():
+                future.set_exception(e)
+            return
+
+        if not future.done():
+            future.set_result(embedding)
+
+    async def close(self) -> None:
+        """Stop batching; pending callers fail and dispatched batches are cancelled."""
+        # Cancelled tasks cannot resolve their callers themselves, so fail them first
+        pending = [*self._collecting]
+        for items in self._batches.values():
+            pending.extend(items)
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        for _, future in pending:
+            if not future.done():
+                future.set_exception(RuntimeError("Embedder was closed"))
+        self._collecting = []
+
+        tasks = [*self._batches]
+        if self._collector_task is not None:
+            tasks.append(self._collector_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._collector_task = None
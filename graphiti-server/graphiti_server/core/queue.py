@@ -1,9 +1,11 @@
 """Episode queue management for per-group processing."""
 
 import asyncio
+import contextlib
 import logging
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Any, Callable
+from typing import Any
 
 from graphiti_core.nodes import EpisodeType
 
@@ -15,24 +17,52 @@ logger = logging.getLogger(__name__)
 class EpisodeQueue:
     """Manages episode processing for a specific group_id."""
 
-    def __init__(self, group_id: str):
-        """Initialize episode queue for a group."""
+    def __init__(
+        self,
+        group_id: str,
+        maxsize: int = 0,
+        workers: int = 1,
+        semaphore: asyncio.Semaphore | None = None,
+    ):
+        """Initialize episode queue for a group.
+
+        Args:
+            group_id: Group ID whose episodes this queue processes
+            maxsize: Maximum number of pending episodes (0 means unbounded)
+            workers: Number of workers pulling from the queue. With a single worker
+                episodes are processed strictly in order.
+            semaphore: Optional semaphore shared across queues to bound the number
+                of episodes processed concurrently
+        """
         self.group_id = group_id
-        self.queue: asyncio.Queue = asyncio.Queue()
-        self.worker_task: asyncio.Task | None = None
-        self.is_running = False
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.workers = max(1, workers)
+        self.semaphore = semaphore
+        self.worker_tasks: list[asyncio.Task] = []
+        self.active = 0
 
-    async def start_worker(self, process_fn: Callable):
-        """Start the queue worker."""
-        if self.is_running:
+    @property
+    def is_running(self) -> bool:
+        """Whether any worker is still processing the queue."""
+        return any(not task.done() for task in self.worker_tasks)
+
+    @property
+    def is_idle(self) -> bool:
+        """Whether the queue has no pending or in-progress episodes."""
+        return self.active == 0 and self.queue.empty()
+
+    async def start_worker(self):
+        """Start the queue workers, replacing any that have exited."""
+        live = [task for task in self.worker_tasks if not task.done()]
+        missing = self.workers - len(live)
+        if missing <= 0:
             return
 
-        self.is_running = True
-        self.worker_task = asyncio.create_task(self._worker(process_fn))
-        logger.info(f"Started episode queue worker for group_id: {self.group_id}")
+        self.worker_tasks = live + [asyncio.create_task(self._worker()) for _ in range(missing)]
+        logger.info(f"Started {missing} episode queue worker(s) for group_id: {self.group_id}")
 
-    async def _worker(self, process_fn: Callable):
-        """Process episodes from the queue sequentially."""
+    async def _worker(self):
+        """Process episodes from the queue until the queue is stopped."""
         try:
             while True:
                 # Get the next episode processing function and optional future
@@ -44,30 +74,29 @@ class EpisodeQueue:
                     episode_fn = item
                     future = None
 
-                result = None
-                error = None
+                self.active += 1
                 try:
-                    result = await episode_fn()
+                    async with self.semaphore or contextlib.nullcontext():
+                        result = await episode_fn()
+                except asyncio.CancelledError:
+                    # The worker exits; get_episode_queue starts a replacement on next use
+                    _fail_future(future, RuntimeError("Episode processing was cancelled"))
+                    raise
                 except Exception as e:
-                    error = e
                     logger.error(
                         f"Error processing queued episode for group_id {self.group_id}: {str(e)}"
                     )
+                    _fail_future(future, e)
+                else:
+                    if future is not None and not future.done():
+                        future.set_result(result)
                 finally:
-                    # Set future result if provided
-                    if future is not None:
-                        if error:
-                            future.set_exception(error)
-                        else:
-                            future.set_result(result)
-
+                    self.active -= 1
                     self.queue.task_done()
         except asyncio.CancelledError:
             logger.info(f"Episode queue worker for group_id {self.group_id} was cancelled")
         except Exception as e:
             logger.error(f"Unexpected error in queue worker for group_id {self.group_id}: {str(e)}")
-        finally:
-            self.is_running = False
 
     async def add_episode(
         self,
@@ -79,6 +108,7 @@ class EpisodeQueue:
         uuid: str | None,
         use_custom_entities: bool,
         wait_for_result: bool = False,
+        enqueue_timeout: float | None = None,
     ):
         """Add an episode to the processing queue.
 
@@ -91,10 +121,15 @@ class EpisodeQueue:
             uuid: Optional episode UUID
             use_custom_entities: Whether to use custom entity types
             wait_for_result: If True, waits for processing and returns the result
+            enqueue_timeout: Seconds to wait for a free slot when the queue is full
+                (None waits indefinitely)
 
         Returns:
             If wait_for_result is False: Queue position (int)
             If wait_for_result is True: AddEpisodeResults from graphiti_core
+
+        Raises:
+            asyncio.QueueFull: If no queue slot became available within enqueue_timeout
         """
 
         async def process_episode():
@@ -119,35 +154,132 @@ class EpisodeQueue:
         if wait_for_result:
             # Create a future to wait for the result
             future: asyncio.Future[Any] = asyncio.Future()
-            await self.queue.put((process_episode, future))
+            await self._put((process_episode, future), enqueue_timeout)
 
             # Wait for the worker to process this episode and return the result
             return await future
         else:
             # Fire-and-forget: just add to queue
-            await self.queue.put(process_episode)
+            await self._put(process_episode, enqueue_timeout)
             return self.queue.qsize()
 
+    async def _put(self, item: Any, timeout: float | None) -> None:
+        """Put an item on the queue, waiting at most timeout seconds for a free slot."""
+        # Fast path avoids creating a waiter task when there is room
+        try:
+            self.queue.put_nowait(item)
+            return
+        except asyncio.QueueFull:
+            pass
+
+        try:
+            await asyncio.wait_for(self.queue.put(item), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Episode queue for group_id {self.group_id} is full")
+            raise asyncio.QueueFull(
+                f"Episode queue for group_id {self.group_id} is full "
+                f"({self.queue.maxsize} pending episodes)"
+            ) from None
+
     async def stop(self):
-        """Stop the queue worker."""
-        if self.worker_task:
-            self.worker_task.cancel()
-            try:
-                await self.worker_task
-            except asyncio.CancelledError:
-                pass
-        self.is_running = False
+        """Stop the queue workers and fail episodes still waiting in the queue."""
+        for task in self.worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self.worker_tasks, return_exceptions=True)
+        self.worker_tasks = []
+
+        # Waiting /memory/sync callers would otherwise never get a result
+        while not self.queue.empty():
+            item = self.queue.get_nowait()
+            if isinstance(item, tuple):
+                _fail_future(
+                    item[1],
+                    RuntimeError(f"Episode queue for group_id {self.group_id} was stopped"),
+                )
+            self.queue.task_done()
+
 
+def _fail_future(future: asyncio.Future | None, error: BaseException) -> None:
+    """Set an exception on a caller's future unless it is already resolved."""
+    if future is not None and not future.done():
+        future.set_exception(error)
 
-# Global registry of episode queues
-_episode_queues: dict[str, EpisodeQueue] = {}
 
+# Global registry of episode queues, least recently used first
+_episode_queues: OrderedDict[str, EpisodeQueue] = OrderedDict()
+
+# Shared limit on episodes processed concurrently across all groups
+_episode_semaphore: asyncio.Semaphore | None = None
+
+
+def set_episode_concurrency(limit: int) -> None:
+    """Limit the number of episodes processed concurrently across all queues."""
+    global _episode_semaphore
+    _episode_semaphore = asyncio.Semaphore(limit)
+
+
+# Guards queue creation so concurrent first requests for a group share one queue
+_episode_queues_lock = asyncio.Lock()
+
+
+async def get_episode_queue(
+    group_id: str, maxsize: int = 0, workers: int = 1, max_queues: int = 0
+) -> EpisodeQueue:
+    """Get or create an episode queue for a group_id, with its workers running.
+
+    Workers of an existing queue that have exited (e.g. after an episode raised
+    CancelledError) are restarted.
+
+    Args:
+        group_id: Group ID to get the queue for
+        maxsize: Maximum number of pending episodes for a new queue
+        workers: Number of workers for a new queue
+        max_queues: Maximum number of queues to keep (0 means unbounded). When
+            exceeded, the least recently used idle queues are stopped and removed.
+    """
+    queue = _episode_queues.get(group_id)
+    if queue is not None:
+        _episode_queues.move_to_end(group_id)
+        await queue.start_worker()
+        return queue
+
+    async with _episode_queues_lock:
+        queue = _episode_queues.get(group_id)
+        if queue is None:
+            queue = EpisodeQueue(
+                group_id, maxsize=maxsize, workers=workers, semaphore=_episode_semaphore
+            )
+            await queue.start_worker()
+            _episode_queues[group_id] = queue
+
+            if max_queues and len(_episode_queues) > max_queues:
+                await _evict_idle_queues(max_queues)
+    return queue
+
+
+async def _evict_idle_queues(max_queues: int) -> None:
+    """Stop and remove least recently used idle queues until at most max_queues remain.
+
+    Only idle queues are evicted, so no queued episode is ever dropped. Callers put
+    onto a queue without yielding after looking it up, and evicted queues are removed
+    from the registry before the first await, so a queue that is idle here has no
+    episode about to be added.
+    """
+    excess = len(_episode_queues) - max_queues
+    # The most recently used queue is the one being handed to a caller, so never evict it
+    candidates = list(_episode_queues.items())[:-1]
+    idle = [group_id for group_id, queue in candidates if queue.is_idle][:excess]
+    evicted = [(group_id, _episode_queues.pop(group_id)) for group_id in idle]
+
+    for group_id, queue in evicted:
+        await queue.stop()
+        logger.info(f"Evicted idle episode queue for group_id: {group_id}")
 
-def get_episode_queue(group_id: str) -> EpisodeQueue:
-    """Get or create an episode queue for a group_id."""
-    if group_id not in _episode_queues:
-        _episode_queues[group_id] = EpisodeQueue(group_id)
-    return _episode_queues[group_id]
+    if len(idle) < excess:
+        logger.warning(
+            f"{len(_episode_queues)} episode queues exceed the limit of {max_queues}; "
+            "no idle queues left to evict"
+        )
 
 
 async def cleanup_all_queues():
@@ -3,12 +3,22 @@
 import logging
 from contextlib import asynccontextmanager
 
+import anyio.to_thread
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from graphiti_server.api.deps import set_graphiti_client
+from graphiti_server.api.profiling import add_profiler
 from graphiti_server.api.routes import admin_router, memory_router, search_router
-from graphiti_server.config import get_config
-from graphiti_server.core import GraphitiClient, cleanup_all_queues
+from graphiti_server.config import PROFILING_ENABLED, get_config
+from graphiti_server.core import (
+    GraphitiClient,
+    cleanup_all_queues,
+    get_episode_queue,
+    set_episode_concurrency,
+    start_clock,
+    stop_clock,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -26,11 +36,29 @@ async def lifespan(app: FastAPI):
 
     config = get_config()
 
+    # Give blocking calls inside graphiti_core more headroom than AnyIO's default
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = config.thread_pool_size
+
     # Initialize Graphiti client
     client = GraphitiClient(config)
     await client.initialize()
     set_graphiti_client(client)
 
+    # Coarse clock for read-path reference times
+    start_clock()
+
+    # Bound episode processing across all group queues
+    set_episode_concurrency(config.episode_concurrency)
+
+    # Start the default group's queue workers up front
+    await get_episode_queue(
+        config.default_group_id,
+        maxsize=config.queue_max_size,
+        workers=config.episode_workers,
+        max_queues=config.max_episode_queues,
+    )
+
     logger.info("Graphiti REST server started successfully")
 
     yield
@@ -41,6 +69,9 @@ async def lifespan(app: FastAPI):
     # Stop all episode queues
     await cleanup_all_queues()
 
+    # Stop the cached clock
+    await stop_clock()
+
     # Close Graphiti client
     await client.close()
 
@@ -54,6 +85,7 @@ def create_app() -> FastAPI:
         description="REST API for Graphiti - a temporally-aware knowledge graph for AI agents",
         version="1.0.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # Include routers
@@ -61,6 +93,9 @@ def create_app() -> FastAPI:
     app.include_router(search_router)
     app.include_router(admin_router)
 
+    if PROFILING_ENABLED:
+        add_profiler(app)
+
     return app
 
 
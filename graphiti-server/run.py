@@ -2,6 +2,7 @@
 """CLI entry point for Graphiti REST Server."""
 
 import argparse
+import dataclasses
 import logging
 import os
 import sys
@@ -58,9 +59,9 @@ def main():
 
         # Apply CLI overrides
         if args.group_id:
-            config.default_group_id = args.group_id
+            config = dataclasses.replace(config, default_group_id=args.group_id)
         if args.use_custom_entities:
-            config.use_custom_entities = True
+            config = dataclasses.replace(config, use_custom_entities=True)
 
         # Set global config
         set_config(config)
@@ -0,0 +1,73 @@
+"""Tests for episode queue management."""
+
+import asyncio
+import unittest
+
+from graphiti_core.nodes import EpisodeType
+
+from graphiti_server.core import queue as queue_module
+from graphiti_server.core.queue import cleanup_all_queues, get_episode_queue
+
+
+class FakeClient:
+    """Graphiti client stand-in that records processed episodes."""
+
+    def __init__(self):
+        self.processed: list[str] = []
+
+    async def add_episode(self, **kwargs):
+        self.processed.append(kwargs["name"])
+
+
+class EvictionTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        queue_module._episode_queues.clear()
+        queue_module._episode_queues_lock = asyncio.Lock()
+
+    async def asyncTearDown(self):
+        await cleanup_all_queues()
+
+    async def test_episode_added_while_evicting_is_processed(self):
+        client = FakeClient()
+        queue_a = await get_episode_queue("A")
+        await get_episode_queue("B")
+
+        # Slow down stopping A so a producer runs while eviction is suspended
+        stop_a = queue_a.stop
+
+        async def slow_stop():
+            await asyncio.sleep(0.05)
+            await stop_a()
+
+        queue_a.stop = slow_stop
+
+        async def produce():
+            await asyncio.sleep(0.01)
+            queue = await get_episode_queue("B", max_queues=1)
+            await queue.add_episode(
+                client, "episode", "body", EpisodeType.text, "test", None, False
+            )
+
+        producer = asyncio.create_task(produce())
+        await get_episode_queue("C", max_queues=1)
+        await producer
+
+        for _ in range(100):
+            if client.processed:
+                break
+            await asyncio.sleep(0.01)
+
+        self.assertEqual(client.processed, ["episode"])
+        self.assertIn("B", queue_module._episode_queues)
+
+    async def test_busy_queues_are_not_evicted(self):
+        queue_a = await get_episode_queue("A")
+        queue_a.active = 1
+        await get_episode_queue("B", max_queues=1)
+
+        self.assertEqual(list(queue_module._episode_queues), ["A", "B"])
+        queue_a.active = 0
+
+
+if __name__ == "__main__":
+    unittest.main()